@@ -6,21 +6,24 @@ import sys
 CROSS_PLATFORM=False
 
 cdict = {}
-for i, l in enumerate(open("gamecontrollerdb.txt")):
-    l = l.strip()
-    if l.startswith("#") or not l:
-        continue
-    
-    c = l.split(",")
-    key = tuple([c[0]]+[ce for ce in c[1:] if "platform:" in ce])
-    if CROSS_PLATFORM:
-        key = c[0]
+with open("gamecontrollerdb.txt", buffering=1 << 20) as f:
+    for i, l in enumerate(f):
+        l = l.strip()
+        if l.startswith("#") or not l:
+            continue
 
-    if key in cdict:
-        print("Duplicate:", c[1], "at line", i + 1)
-        out = list(difflib.unified_diff(cdict[key], sorted(c), n=0))[3:]
-        out = [o for o in out if not o.startswith("@@")]
-        print("\t", " ".join(out))
-        if not CROSS_PLATFORM:
-            sys.exit(1)
-    cdict[key] = sorted(c)
\ No newline at end of file
+        c = l.split(",")
+        if CROSS_PLATFORM:
+            key = c[0]
+        else:
+            key = (c[0], *[ce for ce in c[1:] if ce.startswith("platform:")])
+
+        prev = cdict.setdefault(key, c)
+        if prev is not c:
+            print("Duplicate:", c[1], "at line", i + 1)
+            out = list(difflib.unified_diff(sorted(prev), sorted(c), n=0))[3:]
+            out = [o for o in out if not o.startswith("@@")]
+            print("\t", " ".join(out))
+            if not CROSS_PLATFORM:
+                sys.exit(1)
+            cdict[key] = c
\ No newline at end of file